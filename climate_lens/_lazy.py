@@ -0,0 +1,25 @@
+"""Lazy package exports so importing climate_lens stays free of pandas and Plotly."""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, namespace: Dict[str, Any], exports: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """Return module ``__getattr__``/``__dir__`` hooks resolving ``exports`` on first access.
+
+    ``exports`` maps each public name to the relative submodule defining it;
+    resolved values are cached in ``namespace`` (the package's ``globals()``).
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
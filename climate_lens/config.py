@@ -18,6 +18,10 @@ METRIC_LABELS = {
     "temp_min": "Yearly Minimum Temperature (C)",
     "temp_max": "Yearly Maximum Temperature (C)",
     "R1": "Annual Average Rainfall (mm)",
+    "temp_min_anomaly": "Minimum Temperature Anomaly (C)",
+    "temp_max_anomaly": "Maximum Temperature Anomaly (C)",
+    "temp_mean_anomaly": "Mean Temperature Anomaly (C)",
+    "R1_anomaly": "Rainfall Anomaly (mm)",
 }
 
 POLLUTANT_OPTIONS = ["Air Quality Index", "PM2.5", "PM10"]
@@ -29,6 +33,10 @@ TOP10_OPTIONS = [
     {"label": "Annual Rainfall", "value": "R1"},
     {"label": "CO2 per Capita", "value": "co2_per_capita"},
     {"label": "Total CO2", "value": "co2"},
+    {"label": "Min Temperature Anomaly", "value": "temp_min_anomaly"},
+    {"label": "Max Temperature Anomaly", "value": "temp_max_anomaly"},
+    {"label": "Mean Temperature Anomaly", "value": "temp_mean_anomaly"},
+    {"label": "Rainfall Anomaly", "value": "R1_anomaly"},
 ]
 
 THEME = {
@@ -50,3 +58,9 @@ FIGURE_LAYOUT = {
 CO2_CUTOFF_YEAR = 2020
 FORECAST_START_YEAR = 2019
 DEFAULT_COUNTRIES = ["Canada", "United States"]
+
+ANOMALY_VARIABLES = ("temp_min", "temp_max", "temp_mean", "R1")
+ANOMALY_METRICS = [f"{v}_anomaly" for v in ANOMALY_VARIABLES]
+ANOMALY_REFERENCE_PERIOD = (2003, 2012)
+ANOMALY_MIN_BASELINE_YEARS = 5
+ANOMALY_MIN_YEAR_MONTHS = 9
@@ -1,11 +1,16 @@
 """Data loading, validation, and transformation utilities."""
 
-from .loader import load_datasets
-from .transform import aggregate_by_subregion, compute_global_kpis, get_latest_by_year
-
-__all__ = [
-    "load_datasets",
-    "aggregate_by_subregion",
-    "compute_global_kpis",
-    "get_latest_by_year",
-]
+from climate_lens._lazy import lazy_exports
+
+_EXPORTS = {
+    "build_anomaly_datasets": ".anomaly",
+    "compute_baseline_climatology": ".anomaly",
+    "load_datasets": ".loader",
+    "aggregate_by_subregion": ".transform",
+    "compute_global_kpis": ".transform",
+    "get_latest_by_year": ".transform",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
@@ -0,0 +1,81 @@
+"""Climate anomaly computations against a reference-period baseline."""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from climate_lens.config import ANOMALY_MIN_BASELINE_YEARS, ANOMALY_REFERENCE_PERIOD, ANOMALY_VARIABLES
+
+BASELINE_KEYS = ["country_code", "month"]
+
+
+def anomaly_column(variable: str) -> str:
+    """Return the anomaly column name for a climate variable."""
+    return f"{variable}_anomaly"
+
+
+def _resolve_period(reference_period: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+    start, end = reference_period if reference_period is not None else ANOMALY_REFERENCE_PERIOD
+    if start > end:
+        raise ValueError(f"Invalid anomaly reference period: {start} is after {end}")
+    return int(start), int(end)
+
+
+def compute_baseline_climatology(
+    climate: pd.DataFrame,
+    reference_period: Optional[Tuple[int, int]] = None,
+    min_years: int = ANOMALY_MIN_BASELINE_YEARS,
+) -> pd.DataFrame:
+    """Average each climate variable per country and calendar month over the reference period.
+
+    Baselines backed by fewer than ``min_years`` distinct years are set to NaN.
+    """
+    start, end = _resolve_period(reference_period)
+    in_period = climate["year"].between(start, end)
+    variables = list(ANOMALY_VARIABLES)
+    # Collapse duplicate rows first so the count below is a count of years.
+    per_year = climate.loc[in_period].groupby(BASELINE_KEYS + ["year"])[variables].mean()
+    grouped = per_year.groupby(level=BASELINE_KEYS)
+    baseline = grouped.mean()
+    return baseline.where(grouped.count() >= min_years)
+
+
+def compute_monthly_anomalies(climate: pd.DataFrame, baseline: pd.DataFrame) -> pd.DataFrame:
+    """Subtract the matching country/month baseline from every monthly observation.
+
+    Duplicate country/year/month rows are averaged first, as in the baseline.
+    """
+    variables = list(ANOMALY_VARIABLES)
+    observed = climate.groupby(BASELINE_KEYS + ["year"])[variables].mean()
+    aligned = baseline.reindex(observed.index.droplevel("year"))
+
+    values = observed.to_numpy(dtype=float) - aligned.to_numpy(dtype=float)
+    anomalies = pd.DataFrame(values, index=observed.index, columns=[anomaly_column(v) for v in variables])
+
+    df = anomalies.reset_index()[["country_code", "year", "month"] + list(anomalies.columns)]
+    return df.sort_values(["country_code", "year", "month"]).reset_index(drop=True)
+
+
+def compute_yearly_anomalies(monthly: pd.DataFrame) -> pd.DataFrame:
+    """Average monthly anomalies into one value per country and year.
+
+    Each ``<variable>_anomaly_months`` column counts the months with a non-NaN
+    anomaly behind that mean, so callers can drop partially covered years.
+    """
+    columns = [anomaly_column(v) for v in ANOMALY_VARIABLES]
+    grouped = monthly.groupby(["country_code", "year"])[columns]
+    yearly = grouped.mean()
+    yearly = yearly.join(grouped.count().add_suffix("_months"))
+    return yearly.reset_index()
+
+
+def build_anomaly_datasets(climate: pd.DataFrame, reference_period: Optional[Tuple[int, int]] = None) -> Dict[str, pd.DataFrame]:
+    """Build monthly and yearly anomaly tables from the raw climate dataset."""
+    baseline = compute_baseline_climatology(climate, reference_period)
+    monthly = compute_monthly_anomalies(climate, baseline)
+    return {
+        "climate_anomaly_monthly": monthly,
+        "climate_anomaly_yearly": compute_yearly_anomalies(monthly),
+    }
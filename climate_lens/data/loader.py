@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 
 from climate_lens.config import CO2_CUTOFF_YEAR, DATA_FILES
+from climate_lens.data.anomaly import build_anomaly_datasets
 from climate_lens.data.validator import validate_dataset, validate_year_column
 
 
@@ -20,18 +21,36 @@ def _normalize_country_code(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def load_datasets() -> Dict[str, pd.DataFrame]:
-    """Load and validate all runtime datasets used by the dashboard."""
+def read_datasets() -> Dict[str, pd.DataFrame]:
+    """Parse and validate the raw runtime CSV files."""
     datasets = {name: _normalize_country_code(_read_csv(path)) for name, path in DATA_FILES.items()}
 
     for name, df in datasets.items():
         validate_dataset(name, df)
         validate_year_column(name, df)
+    return datasets
+
+
+def merge_datasets(
+    datasets: Dict[str, pd.DataFrame], reference_period: Optional[Tuple[int, int]] = None
+) -> Dict[str, pd.DataFrame]:
+    """Derive anomalies, attach country metadata, and split the CO2 forecast."""
+    datasets = dict(datasets)
+    datasets.update(build_anomaly_datasets(datasets["climate"], reference_period))
 
     countries = datasets["countries"]
-    for key in ("aq", "climate", "co2"):
+    for key in ("aq", "climate", "co2", "climate_anomaly_monthly", "climate_anomaly_yearly"):
         datasets[key] = datasets[key].merge(countries, on="country_code", how="left")
 
     datasets["co2_forecast"] = datasets["co2"].copy()
     datasets["co2"] = datasets["co2"][datasets["co2"]["year"] < CO2_CUTOFF_YEAR].copy()
     return datasets
+
+
+def load_datasets(reference_period: Optional[Tuple[int, int]] = None) -> Dict[str, pd.DataFrame]:
+    """Load and validate all runtime datasets used by the dashboard.
+
+    Climate anomalies are computed once against ``reference_period`` (defaults to
+    ``ANOMALY_REFERENCE_PERIOD``) and cached in the returned mapping.
+    """
+    return merge_datasets(read_datasets(), reference_period)
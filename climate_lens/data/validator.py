@@ -8,7 +8,7 @@ import pandas as pd
 REQUIRED_COLUMNS = {
     "aq": {"country_code", "aq", "PM2.5", "PM10"},
     "countries": {"country_code", "country_name", "sub_region"},
-    "climate": {"country_code", "year", "temp_min", "temp_max", "R1"},
+    "climate": {"country_code", "year", "month", "temp_min", "temp_max", "temp_mean", "R1"},
     "co2": {"country_code", "year", "co2", "co2_per_capita"},
 }
 
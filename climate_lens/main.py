@@ -1,7 +1,7 @@
 """Application entrypoint for local execution."""
 
-from dashboard import app
+from dashboard import main
 
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    main(debug=True)
@@ -0,0 +1,33 @@
+"""Startup phase timing for the dashboard."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator, List, Tuple
+
+
+class StartupReport:
+    """Collect wall-clock durations for named startup phases."""
+
+    def __init__(self) -> None:
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, perf_counter() - start))
+
+    @property
+    def total(self) -> float:
+        return sum(seconds for _, seconds in self.phases)
+
+    def format(self) -> str:
+        """Render phases as an aligned table with a total row."""
+        width = max([len(name) for name, _ in self.phases] + [len("total")])
+        lines = [f"{name:<{width}}  {seconds * 1000:9.1f} ms" for name, seconds in self.phases]
+        lines.append(f"{'total':<{width}}  {self.total * 1000:9.1f} ms")
+        return "\n".join(lines)
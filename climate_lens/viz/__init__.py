@@ -1,10 +1,14 @@
 """Visualization helpers and theme constants."""
 
-from .figures import build_choropleth, build_pie_distribution, build_time_series, build_top10
-
-__all__ = [
-    "build_choropleth",
-    "build_pie_distribution",
-    "build_time_series",
-    "build_top10",
-]
+from climate_lens._lazy import lazy_exports
+
+_EXPORTS = {
+    "build_choropleth": ".figures",
+    "build_pie_distribution": ".figures",
+    "build_time_series": ".figures",
+    "build_top10": ".figures",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 import pandas as pd
 import plotly.graph_objs as go
 
-from climate_lens.config import FIGURE_LAYOUT, FORECAST_START_YEAR, METRIC_LABELS, THEME
+from climate_lens.config import ANOMALY_METRICS, ANOMALY_MIN_YEAR_MONTHS, FIGURE_LAYOUT, FORECAST_START_YEAR, METRIC_LABELS, THEME
+
+
+def _require_anomalies(metric: str, *frames: Optional[pd.DataFrame]) -> None:
+    if any(frame is None for frame in frames):
+        raise ValueError(f"Metric '{metric}' requires the climate anomaly datasets")
+
+
+def _covered_years(anomaly_yearly: pd.DataFrame, metric: str) -> pd.DataFrame:
+    return anomaly_yearly[anomaly_yearly[f"{metric}_months"] >= ANOMALY_MIN_YEAR_MONTHS]
 
 
-def build_time_series(selected_countries, selected_metric, co2_forecast, climate):
+def build_time_series(
+    selected_countries,
+    selected_metric,
+    co2_forecast,
+    climate,
+    anomaly_monthly: Optional[pd.DataFrame] = None,
+    anomaly_yearly: Optional[pd.DataFrame] = None,
+):
     fig = go.Figure()
     palette = [
         "#4aa8ff",
@@ -53,6 +71,35 @@ def build_time_series(selected_countries, selected_metric, co2_forecast, climate
                         marker={"color": color, "size": 6},
                     )
                 )
+        elif selected_metric in ANOMALY_METRICS:
+            _require_anomalies(selected_metric, anomaly_monthly, anomaly_yearly)
+            m = anomaly_monthly[anomaly_monthly["country_name"] == country]
+            y = _covered_years(anomaly_yearly, selected_metric)
+            y = y[y["country_name"] == country].sort_values("year")
+            fig.add_trace(
+                go.Scatter(
+                    x=m["year"] + (m["month"] - 1) / 12,
+                    y=m[selected_metric],
+                    mode="lines",
+                    name=country,
+                    legendgroup=country,
+                    showlegend=False,
+                    opacity=0.35,
+                    line={"color": color, "width": 1},
+                    hoverinfo="skip",
+                )
+            )
+            fig.add_trace(
+                go.Scatter(
+                    x=y["year"],
+                    y=y[selected_metric],
+                    mode="lines+markers",
+                    name=country,
+                    legendgroup=country,
+                    line={"dash": "solid", "color": color, "width": 2.5},
+                    marker={"color": color, "size": 6},
+                )
+            )
         else:
             d = (
                 climate[climate["country_name"] == country]
@@ -128,7 +175,14 @@ def build_pie_distribution(co2: pd.DataFrame):
     return fig
 
 
-def build_top10(metric: str, order: str, co2: pd.DataFrame, climate: pd.DataFrame, aq: pd.DataFrame):
+def build_top10(
+    metric: str,
+    order: str,
+    co2: pd.DataFrame,
+    climate: pd.DataFrame,
+    aq: pd.DataFrame,
+    anomaly_yearly: Optional[pd.DataFrame] = None,
+):
     latest_year_co2 = co2["year"].max()
     latest_year_climate = climate["year"].max()
     latest_year_aq = aq["year"].max() if "year" in aq.columns else None
@@ -140,6 +194,11 @@ def build_top10(metric: str, order: str, co2: pd.DataFrame, climate: pd.DataFram
             df_latest["co2_per_capita"] = df_latest["co2"] / df_latest["population"]
     elif metric in ["temp_max", "temp_min", "R1"]:
         df_latest = climate[climate["year"] == latest_year_climate].copy()
+    elif metric in ANOMALY_METRICS:
+        _require_anomalies(metric, anomaly_yearly)
+        # Rank on the latest year with enough months per country, not a partial one.
+        covered = _covered_years(anomaly_yearly, metric)
+        df_latest = covered[covered["year"] == covered["year"].max()].copy()
     else:
         df_latest = aq.copy()
         if latest_year_aq is not None:
@@ -0,0 +1,379 @@
+"""Load generator for the dashboard's Dash callbacks.
+
+Simulated users open the page (which fires all four callbacks with their
+initial values) and then perform a weighted mix of interactions, each posted
+to ``/_dash-update-component`` exactly as the browser would. Requests go to
+the in-process Flask test client by default, or to a running server with
+``--url``.
+
+Examples::
+
+    python scripts/load_test.py --concurrency 8 --duration 30
+    python scripts/load_test.py --url http://127.0.0.1:8050 --requests 2000
+    python scripts/load_test.py --mix add_country=5,switch_metric=1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+UPDATE_PATH = "/_dash-update-component"
+
+CALLBACKS = {
+    "update_ts": ("ts-graph", ["country-dropdown", "metric-dropdown"]),
+    "update_pie": ("pie-graph", ["metric-dropdown"]),
+    "update_top10": ("top10-graph", ["top10-dropdown", "top10-order-dropdown"]),
+    "update_choro": ("choro-graph", ["aq-dropdown"]),
+}
+
+DEFAULT_MIX = {
+    "add_country": 4,
+    "switch_metric": 3,
+    "flip_top10": 2,
+    "change_pollutant": 1,
+}
+
+MAX_SELECTED_COUNTRIES = 8
+
+DEFAULT_DURATION = 10.0
+
+
+class FlaskTransport:
+    """Post to the in-process app through one Flask test client per thread."""
+
+    def __init__(self) -> None:
+        import dashboard
+
+        self._app = dashboard.get_app()
+        self._local = threading.local()
+
+    def _client(self):
+        if not hasattr(self._local, "client"):
+            self._local.client = self._app.server.test_client()
+        return self._local.client
+
+    def get_json(self, path: str):
+        response = self._client().get(path)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path} returned HTTP {response.status_code}")
+        return response.get_json()
+
+    def post_json(self, path: str, payload: dict) -> int:
+        return self._client().post(path, json=payload).status_code
+
+
+class HttpTransport:
+    """Post to a running server over HTTP."""
+
+    def __init__(self, base_url: str, timeout: float) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def get_json(self, path: str):
+        with urllib.request.urlopen(self.base_url + path, timeout=self.timeout) as response:
+            return json.load(response)
+
+    def post_json(self, path: str, payload: dict) -> int:
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as exc:
+            return exc.code
+
+
+def _find_component(node, component_id: str) -> Optional[dict]:
+    if isinstance(node, list):
+        for child in node:
+            found = _find_component(child, component_id)
+            if found is not None:
+                return found
+    elif isinstance(node, dict):
+        props = node.get("props", {})
+        if props.get("id") == component_id:
+            return props
+        return _find_component(props.get("children"), component_id)
+    return None
+
+
+def read_layout_options(transport) -> Dict[str, dict]:
+    """Pull dropdown options and initial values from the served layout."""
+    layout = transport.get_json("/_dash-layout")
+    controls = {}
+    for component_id in ("country-dropdown", "metric-dropdown", "top10-dropdown", "top10-order-dropdown", "aq-dropdown"):
+        props = _find_component(layout, component_id)
+        if props is None:
+            raise RuntimeError(f"Component '{component_id}' not found in the served layout")
+        controls[component_id] = {
+            "values": [option["value"] for option in props.get("options", [])],
+            "initial": props.get("value"),
+        }
+    return controls
+
+
+def build_payload(callback: str, state: Dict[str, object], changed: List[str]) -> dict:
+    """Build the JSON body Dash's renderer sends for one callback."""
+    output_id, input_ids = CALLBACKS[callback]
+    return {
+        "output": f"{output_id}.figure",
+        "outputs": {"id": output_id, "property": "figure"},
+        "inputs": [{"id": i, "property": "value", "value": state[i]} for i in input_ids],
+        "changedPropIds": [f"{i}.value" for i in changed if i in input_ids],
+        "state": [],
+    }
+
+
+class UserSession:
+    """One simulated user holding the current value of every dropdown."""
+
+    def __init__(self, controls: Dict[str, dict], mix: Dict[str, int], rng: random.Random) -> None:
+        self.controls = controls
+        self.actions = list(mix)
+        self.weights = [mix[a] for a in self.actions]
+        self.rng = rng
+        self.state = {component_id: spec["initial"] for component_id, spec in controls.items()}
+        self.state["country-dropdown"] = list(self.state["country-dropdown"] or [])
+
+    def page_load(self) -> List[Tuple[str, dict]]:
+        return [(name, build_payload(name, self.state, [])) for name in CALLBACKS]
+
+    def next_interaction(self) -> List[Tuple[str, dict]]:
+        action = self.rng.choices(self.actions, weights=self.weights)[0]
+        changed = getattr(self, f"_{action}")()
+        return [
+            (name, build_payload(name, self.state, [changed]))
+            for name, (_, input_ids) in CALLBACKS.items()
+            if changed in input_ids
+        ]
+
+    def _pick_other(self, component_id: str):
+        values = self.controls[component_id]["values"]
+        choices = [v for v in values if v != self.state[component_id]] or values
+        return self.rng.choice(choices)
+
+    def _add_country(self) -> str:
+        selected = self.state["country-dropdown"]
+        if len(selected) >= MAX_SELECTED_COUNTRIES:
+            self.state["country-dropdown"] = list(self.controls["country-dropdown"]["initial"] or [])
+        else:
+            remaining = [c for c in self.controls["country-dropdown"]["values"] if c not in selected]
+            if remaining:
+                self.state["country-dropdown"] = selected + [self.rng.choice(remaining)]
+        return "country-dropdown"
+
+    def _switch_metric(self) -> str:
+        self.state["metric-dropdown"] = self._pick_other("metric-dropdown")
+        return "metric-dropdown"
+
+    def _flip_top10(self) -> str:
+        component_id = self.rng.choice(["top10-dropdown", "top10-order-dropdown"])
+        self.state[component_id] = self._pick_other(component_id)
+        return component_id
+
+    def _change_pollutant(self) -> str:
+        self.state["aq-dropdown"] = self._pick_other("aq-dropdown")
+        return "aq-dropdown"
+
+
+class Results:
+    """Thread-safe latency and status collection per callback."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, callback: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self.latencies[callback].append(seconds)
+            if not ok:
+                self.errors[callback] += 1
+
+    @property
+    def count(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self.latencies.values())
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _worker(
+    transport,
+    controls: Dict[str, dict],
+    mix: Dict[str, int],
+    actions_per_session: int,
+    seed: int,
+    results: Results,
+    stop_at: float,
+    budget: threading.Semaphore,
+) -> None:
+    rng = random.Random(seed)
+
+    def send(batch) -> bool:
+        for callback, payload in batch:
+            if not budget.acquire(blocking=False):
+                return False
+            start = time.perf_counter()
+            try:
+                ok = transport.post_json(UPDATE_PATH, payload) == 200
+            except Exception:
+                ok = False
+            results.record(callback, time.perf_counter() - start, ok)
+        return True
+
+    while time.perf_counter() < stop_at:
+        session = UserSession(controls, mix, rng)
+        if not send(session.page_load()):
+            return
+        for _ in range(actions_per_session):
+            if time.perf_counter() >= stop_at or not send(session.next_interaction()):
+                return
+
+
+def run_load(
+    transport,
+    controls: Dict[str, dict],
+    mix: Dict[str, int],
+    concurrency: int,
+    actions_per_session: int,
+    seed: int,
+    duration: Optional[float] = None,
+    requests: Optional[int] = None,
+) -> Tuple[Results, float]:
+    """Drive ``concurrency`` simulated users until ``duration`` or ``requests`` runs out."""
+    mix = {name: weight for name, weight in mix.items() if weight > 0}
+    results = Results()
+    budget = threading.Semaphore(requests if requests is not None else 2**31 - 1)
+    start = time.perf_counter()
+    # Whichever of duration and requests is hit first ends the run.
+    stop_at = start + duration if duration is not None else math.inf
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [
+            pool.submit(_worker, transport, controls, mix, actions_per_session, seed + i, results, stop_at, budget)
+            for i in range(concurrency)
+        ]
+        for future in futures:
+            future.result()
+    return results, time.perf_counter() - start
+
+
+def format_report(results: Results, elapsed: float, concurrency: int) -> str:
+    header = f"{'callback':<14}{'requests':>10}{'errors':>8}{'err %':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    lines = [header, "-" * len(header)]
+    rows = [(name, results.latencies.get(name, [])) for name in CALLBACKS]
+    rows.append(("all", [s for v in results.latencies.values() for s in v]))
+    for name, values in rows:
+        errors = sum(results.errors.values()) if name == "all" else results.errors.get(name, 0)
+        error_pct = errors / len(values) * 100 if values else 0.0
+        lines.append(
+            f"{name:<14}{len(values):>10}{errors:>8}{error_pct:>8.2f}"
+            f"{percentile(values, 50) * 1000:>10.1f}"
+            f"{percentile(values, 95) * 1000:>10.1f}"
+            f"{percentile(values, 99) * 1000:>10.1f}"
+        )
+    total = results.count
+    lines.append("")
+    lines.append(f"concurrency {concurrency}, {total} requests in {elapsed:.2f} s, {total / elapsed if elapsed else 0:.1f} req/s")
+    return "\n".join(lines)
+
+
+def _positive_int(text: str) -> int:
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}' is not an integer") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    mix = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, _, weight = item.partition("=")
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown interaction '{name}'; choose from {', '.join(DEFAULT_MIX)}")
+        try:
+            mix[name] = int(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Weight for '{name}' must be an integer") from None
+        if mix[name] < 0:
+            raise argparse.ArgumentTypeError(f"Weight for '{name}' must not be negative")
+    if not any(weight > 0 for weight in mix.values()):
+        raise argparse.ArgumentTypeError("Interaction mix needs at least one positive weight")
+    return mix
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Replay simulated user interactions against the dashboard callbacks.")
+    parser.add_argument("--url", help="base URL of a running server; defaults to the in-process Flask test client")
+    parser.add_argument("--concurrency", type=_positive_int, default=4, help="number of simulated users running in parallel")
+    parser.add_argument(
+        "--duration",
+        type=float,
+        help=f"stop after this many seconds (default {DEFAULT_DURATION:g} when --requests is not given either)",
+    )
+    parser.add_argument("--requests", type=_positive_int, help="stop after this many callback requests")
+    parser.add_argument("--actions-per-session", type=int, default=10, help="interactions before a user reloads the page")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="interaction weights, e.g. add_country=4,switch_metric=3,flip_top10=2,change_pollutant=1",
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout for --url")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for reproducible interaction streams")
+    args = parser.parse_args(argv)
+    if args.duration is None and args.requests is None:
+        args.duration = DEFAULT_DURATION
+
+    transport = HttpTransport(args.url, args.timeout) if args.url else FlaskTransport()
+    start = time.perf_counter()
+    controls = read_layout_options(transport)
+    print(f"warmup (first layout request): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    results, elapsed = run_load(
+        transport,
+        controls,
+        args.mix,
+        args.concurrency,
+        args.actions_per_session,
+        args.seed,
+        duration=args.duration,
+        requests=args.requests,
+    )
+
+    print(format_report(results, elapsed, args.concurrency))
+    if args.requests is not None and results.count < args.requests:
+        print(f"note: --duration {args.duration:g} s elapsed after {results.count} of {args.requests} requests")
+
+
+if __name__ == "__main__":
+    main()
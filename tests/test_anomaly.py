@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from climate_lens.data.anomaly import (
+    _resolve_period,
+    compute_baseline_climatology,
+    compute_monthly_anomalies,
+    compute_yearly_anomalies,
+)
+
+
+def _climate():
+    rows = []
+    for year, offset in [(2000, 0.0), (2001, 2.0), (2002, 10.0)]:
+        for month in (1, 2):
+            value = month * 10 + offset
+            rows.append(("AAA", year, month, value, value + 1, value - 1, value * 2))
+    return pd.DataFrame(rows, columns=["country_code", "year", "month", "temp_mean", "temp_max", "temp_min", "R1"])
+
+
+def test_baseline_uses_only_reference_years():
+    baseline = compute_baseline_climatology(_climate(), (2000, 2001), min_years=1)
+    assert baseline.loc[("AAA", 1), "temp_mean"] == pytest.approx(11.0)
+    assert baseline.loc[("AAA", 2), "R1"] == pytest.approx(42.0)
+
+
+def test_baseline_below_min_years_is_nan():
+    baseline = compute_baseline_climatology(_climate(), (2000, 2001), min_years=3)
+    assert baseline["temp_mean"].isna().all()
+
+
+def test_anomaly_is_value_minus_baseline():
+    climate = _climate()
+    baseline = compute_baseline_climatology(climate, (2000, 2001), min_years=1)
+    monthly = compute_monthly_anomalies(climate, baseline)
+    row = monthly[(monthly["year"] == 2002) & (monthly["month"] == 1)].iloc[0]
+    assert row["temp_mean_anomaly"] == pytest.approx(20.0 - 11.0)
+    assert row["R1_anomaly"] == pytest.approx(40.0 - 22.0)
+
+
+def test_yearly_anomaly_is_mean_of_months():
+    climate = _climate()
+    baseline = compute_baseline_climatology(climate, (2000, 2001), min_years=1)
+    yearly = compute_yearly_anomalies(compute_monthly_anomalies(climate, baseline))
+    row = yearly[yearly["year"] == 2002].iloc[0]
+    assert row["temp_mean_anomaly"] == pytest.approx(9.0)
+    assert row["temp_mean_anomaly_months"] == 2
+
+
+def test_nan_baseline_month_is_not_counted():
+    climate = _climate()
+    climate = climate[~((climate["month"] == 2) & (climate["year"] == 2001))]
+    baseline = compute_baseline_climatology(climate, (2000, 2001), min_years=2)
+    yearly = compute_yearly_anomalies(compute_monthly_anomalies(climate, baseline))
+    row = yearly[yearly["year"] == 2002].iloc[0]
+    assert row["temp_mean_anomaly_months"] == 1
+    assert row["temp_mean_anomaly"] == pytest.approx(20.0 - 11.0)
+
+
+def test_duplicate_rows_are_averaged():
+    climate = _climate()
+    duplicate = climate[(climate["year"] == 2002) & (climate["month"] == 1)].copy()
+    duplicate[["temp_mean", "temp_max", "temp_min", "R1"]] += 2.0
+    climate = pd.concat([climate, duplicate], ignore_index=True)
+    baseline = compute_baseline_climatology(climate, (2000, 2001), min_years=1)
+    monthly = compute_monthly_anomalies(climate, baseline)
+    rows = monthly[(monthly["year"] == 2002) & (monthly["month"] == 1)]
+    assert len(rows) == 1
+    assert rows.iloc[0]["temp_mean_anomaly"] == pytest.approx(21.0 - 11.0)
+    yearly = compute_yearly_anomalies(monthly)
+    assert yearly[yearly["year"] == 2002].iloc[0]["temp_mean_anomaly_months"] == 2
+
+
+def test_reversed_reference_period_raises():
+    with pytest.raises(ValueError, match="reference period"):
+        _resolve_period((2012, 2003))
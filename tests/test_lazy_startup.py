@@ -0,0 +1,24 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHECK = """
+import sys
+
+import climate_lens.data
+import climate_lens.viz
+import dashboard
+
+heavy = sorted({"pandas", "plotly", "dash"} & {name.split(".")[0] for name in sys.modules})
+assert not heavy, f"importing pulled in {heavy}"
+
+dashboard.create_app()
+assert dashboard._data is None, "create_app() loaded data"
+"""
+
+
+def test_imports_and_create_app_stay_lazy():
+    result = subprocess.run([sys.executable, "-c", CHECK], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
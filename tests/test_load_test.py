@@ -0,0 +1,70 @@
+import argparse
+import importlib.util
+import random
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "load_test.py"
+spec = importlib.util.spec_from_file_location("load_test", SCRIPT)
+load_test = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(load_test)
+
+CONTROLS = {
+    "country-dropdown": {"values": ["Canada", "United States", "Mexico"], "initial": ["Canada"]},
+    "metric-dropdown": {"values": ["co2", "R1"], "initial": "co2"},
+    "top10-dropdown": {"values": ["co2", "aq"], "initial": "co2"},
+    "top10-order-dropdown": {"values": ["best", "worst"], "initial": "best"},
+    "aq-dropdown": {"values": ["PM2.5", "PM10"], "initial": "PM2.5"},
+}
+
+
+def test_parse_mix_accepts_zero_weights_alongside_positive():
+    assert load_test.parse_mix("add_country=2,switch_metric=0") == {"add_country": 2, "switch_metric": 0}
+
+
+@pytest.mark.parametrize("text", ["add_country=-1", "add_country=0", "add_country=x", "unknown=1"])
+def test_parse_mix_rejects_invalid_mixes(text):
+    with pytest.raises(argparse.ArgumentTypeError):
+        load_test.parse_mix(text)
+
+
+def test_percentile_nearest_rank():
+    values = [4.0, 1.0, 3.0, 2.0]
+    assert load_test.percentile(values, 50) == 2.0
+    assert load_test.percentile(values, 99) == 4.0
+    assert load_test.percentile(values, 0) == 1.0
+    assert load_test.percentile([7.0], 95) == 7.0
+    assert load_test.percentile([], 50) == 0.0
+
+
+def test_build_payload_lists_inputs_and_changed_props():
+    state = {"country-dropdown": ["Canada"], "metric-dropdown": "R1"}
+    payload = load_test.build_payload("update_ts", state, ["metric-dropdown"])
+    assert payload["output"] == "ts-graph.figure"
+    assert [i["value"] for i in payload["inputs"]] == [["Canada"], "R1"]
+    assert payload["changedPropIds"] == ["metric-dropdown.value"]
+
+
+@pytest.mark.parametrize(
+    "action, callbacks",
+    [
+        ("add_country", {"update_ts"}),
+        ("switch_metric", {"update_ts", "update_pie"}),
+        ("flip_top10", {"update_top10"}),
+        ("change_pollutant", {"update_choro"}),
+    ],
+)
+def test_next_interaction_fires_dependent_callbacks(action, callbacks):
+    session = load_test.UserSession(CONTROLS, {action: 1}, random.Random(0))
+    assert {name for name, _ in session.next_interaction()} == callbacks
+
+
+def test_flask_smoke_run_has_no_errors():
+    transport = load_test.FlaskTransport()
+    controls = load_test.read_layout_options(transport)
+    results, _ = load_test.run_load(
+        transport, controls, load_test.DEFAULT_MIX, concurrency=2, actions_per_session=5, seed=0, requests=20
+    )
+    assert results.count == 20
+    assert sum(results.errors.values()) == 0